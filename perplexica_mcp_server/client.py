@@ -2,74 +2,324 @@
 
 import json
 import asyncio
-from typing import AsyncGenerator, Optional
+import random
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+from typing import AsyncGenerator, List, Optional
 import httpx
+import orjson
+from pydantic import TypeAdapter
 
 from .models import SearchRequest, SearchResponse, StreamMessage, Source, PerplexicaConfig
 
+# Precompiled adapter; validate_python runs entirely in pydantic-core,
+# which is faster than the model constructor path.
+_SEARCH_RESPONSE_ADAPTER = TypeAdapter(SearchResponse)
+
+# Known stream frame types; membership here replaces a full pydantic
+# validation pass per frame.
+_STREAM_MESSAGE_TYPES = frozenset(("init", "sources", "response", "done", "error"))
+
+
+def _parse_stream_line(line) -> Optional[StreamMessage]:
+    """Parse one stream frame, or None if it isn't a valid message.
+
+    On a high-frequency token stream the per-frame pydantic pass is the
+    bulk of the CPU cost, so the type tag is checked directly and the
+    message assembled with model_construct.
+    """
+    try:
+        data = orjson.loads(line)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(data, dict) or data.get("type") not in _STREAM_MESSAGE_TYPES:
+        return None
+    return StreamMessage.model_construct(type=data["type"], data=data.get("data"))
+
+# Upstream statuses worth retrying; anything else is a hard failure.
+_RETRY_STATUSES = frozenset({502, 503, 504})
+
 
 class PerplexicaClient:
     """Client for interacting with Perplexica API."""
     
     def __init__(self, config: PerplexicaConfig):
         self.config = config
+        # HTTP/2 multiplexes requests over one connection and the
+        # keep-alive pool amortizes handshakes across consecutive calls.
         self.client = httpx.AsyncClient(
             base_url=config.base_url,
-            timeout=httpx.Timeout(config.timeout)
+            timeout=httpx.Timeout(config.timeout),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=30.0
+            ),
+            headers={
+                "Content-Type": "application/json",
+                "Accept-Encoding": "gzip, br, zstd"
+            }
         )
+        # Bound outbound concurrency so a burst of tool calls cannot
+        # overwhelm the upstream Perplexica server.
+        self._semaphore = asyncio.Semaphore(config.max_concurrent)
+        # Serialized model configs keyed by object id; the model instance
+        # is kept in the value so its id cannot be recycled while cached.
+        self._model_dump_cache: dict = {}
+        # Last health probe as (monotonic timestamp, healthy); failures
+        # are cached for a shorter window so recovery is noticed quickly.
+        self._health_cache: Optional[tuple] = None
+        self._health_ttl = 5.0
+        self._health_failure_ttl = 1.0
+        # Serialized static portion of default-settings streaming bodies,
+        # built lazily on first use.
+        self._stream_body_prefix: Optional[bytes] = None
+        # LRU cache of (monotonic timestamp, SearchResponse) keyed by a
+        # digest of the request body; only history-free, non-streaming
+        # requests are cached since those are effectively pure queries.
+        self._search_cache: OrderedDict = OrderedDict()
     
     async def __aenter__(self):
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.client.aclose()
-    
+
+    def _dump_model(self, model) -> dict:
+        """Serialize a chat/embedding model config, memoized per instance.
+
+        Default models from config are reused across every request, so
+        their Pydantic dump only needs to run once. The name/model field
+        sync happens at model construction time.
+        """
+        cached = self._model_dump_cache.get(id(model))
+        if cached is not None:
+            return cached[1]
+        data = model.model_dump(exclude_none=True)
+        self._model_dump_cache[id(model)] = (model, data)
+        return data
+
+    async def _post_with_retry(
+        self, url: str, content: bytes, stream: bool = False
+    ) -> httpx.Response:
+        """POST with exponential backoff and jitter on transient failures.
+
+        Retries network errors and 502/503/504 responses, honoring a
+        Retry-After header when the server sends one. Reuses the pooled
+        connection, so retries pay no handshake cost. With stream=True
+        the response body is left unread; the caller must close it.
+        """
+        retries = self.config.retries
+        last_exc: Optional[httpx.RequestError] = None
+        response: Optional[httpx.Response] = None
+
+        for attempt in range(retries + 1):
+            try:
+                async with self._semaphore:
+                    # Content-Type comes from the client's default headers
+                    if stream:
+                        request = self.client.build_request(
+                            "POST", url, content=content
+                        )
+                        response = await self.client.send(request, stream=True)
+                    else:
+                        response = await self.client.post(url, content=content)
+            except httpx.RequestError as e:
+                last_exc = e
+                response = None
+            else:
+                if response.status_code not in _RETRY_STATUSES:
+                    return response
+                if stream:
+                    # Drain before closing: the connection stays reusable
+                    # for the retry, and if this was the last attempt the
+                    # cached body keeps error reporting on the returned
+                    # response working.
+                    await response.aread()
+                    await response.aclose()
+                last_exc = None
+
+            if attempt < retries:
+                delay = self.config.backoff_base * (2 ** attempt) + random.random() * 0.1
+                if response is not None:
+                    retry_after = response.headers.get("Retry-After")
+                    if retry_after is not None:
+                        try:
+                            delay = max(delay, float(retry_after))
+                        except ValueError:
+                            pass
+                await asyncio.sleep(delay)
+
+        if last_exc is not None:
+            raise last_exc
+        return response
+
+    def _build_request_data(self, request: SearchRequest) -> dict:
+        """Build the wire payload for a search request."""
+        request_data = request.model_dump(
+            exclude_none=True, exclude={"chatModel", "embeddingModel"}
+        )
+        if request.chatModel is not None:
+            request_data["chatModel"] = self._dump_model(request.chatModel)
+        if request.embeddingModel is not None:
+            request_data["embeddingModel"] = self._dump_model(request.embeddingModel)
+        return request_data
+
+    def _stream_body(self, request: SearchRequest) -> bytes:
+        """Serialize a streaming search body.
+
+        For requests that carry only the config defaults, everything but
+        query and focusMode is constant, so the serialized prefix is
+        built once and per-call work is reduced to encoding those two
+        strings and concatenating.
+        """
+        config = self.config
+        if (request.history is None
+                and request.systemInstructions is None
+                and request.chatModel is config.default_chat_model
+                and request.embeddingModel is config.default_embedding_model
+                and request.optimizationMode == config.default_optimization_mode):
+            prefix = self._stream_body_prefix
+            if prefix is None:
+                static = {
+                    "optimizationMode": config.default_optimization_mode,
+                    "stream": True
+                }
+                if config.default_chat_model is not None:
+                    static["chatModel"] = self._dump_model(config.default_chat_model)
+                if config.default_embedding_model is not None:
+                    static["embeddingModel"] = self._dump_model(config.default_embedding_model)
+                # Drop the closing brace so per-call fields can be appended
+                prefix = orjson.dumps(static)[:-1]
+                self._stream_body_prefix = prefix
+            return (
+                prefix
+                + b',"focusMode":' + orjson.dumps(request.focusMode)
+                + b',"query":' + orjson.dumps(request.query)
+                + b"}"
+            )
+        return orjson.dumps({**self._build_request_data(request), "stream": True})
+
+
+    async def _post_search(self, request_data: dict, cacheable: bool) -> SearchResponse:
+        """POST a prepared search payload and parse the response."""
+        cache_key = None
+        if cacheable and self.config.search_cache_size > 0:
+            cache_key = blake2b(
+                orjson.dumps(request_data, option=orjson.OPT_SORT_KEYS)
+            ).digest()
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                ts, cached_response = cached
+                if time.monotonic() - ts < self.config.search_cache_ttl:
+                    self._search_cache.move_to_end(cache_key)
+                    return cached_response
+                del self._search_cache[cache_key]
+
+        # Serialize with orjson rather than letting httpx run the
+        # payload through stdlib json.dumps; orjson emits bytes
+        # directly so there is no extra encode step.
+        # Stream the body into one buffer instead of letting httpx
+        # buffer it internally first; receive overlaps with the
+        # chunk handling and the response is released promptly.
+        response = await self._post_with_retry(
+            "/api/search", orjson.dumps(request_data), stream=True
+        )
+        try:
+            if response.status_code >= 400:
+                await response.aread()
+            response.raise_for_status()
+
+            buf = bytearray()
+            async for chunk in response.aiter_bytes(
+                chunk_size=self.config.stream_chunk_size
+            ):
+                buf += chunk
+        finally:
+            await response.aclose()
+
+        # orjson parses the raw bytes directly, skipping the UTF-8
+        # decode pass that response.json() would do.
+        data = orjson.loads(buf)
+        result = _SEARCH_RESPONSE_ADAPTER.validate_python(data)
+
+        if cache_key is not None:
+            self._search_cache[cache_key] = (time.monotonic(), result)
+            if len(self._search_cache) > self.config.search_cache_size:
+                self._search_cache.popitem(last=False)
+
+        return result
+
     async def search(self, request: SearchRequest) -> SearchResponse:
         """Perform a search and return the complete response."""
-        
+
         # Apply defaults from config
         if request.chatModel is None and self.config.default_chat_model:
             request.chatModel = self.config.default_chat_model
-        
+
         if request.embeddingModel is None and self.config.default_embedding_model:
             request.embeddingModel = self.config.default_embedding_model
-        
+
         if request.optimizationMode is None:
             request.optimizationMode = self.config.default_optimization_mode
-        
+
         try:
-            # Convert model names to use the 'model' field for the actual API call
-            request_data = request.model_dump(exclude_none=True)
-            
-            # Ensure chat model uses 'model' field for API compatibility
-            if "chatModel" in request_data and request_data["chatModel"]:
-                chat_model = request_data["chatModel"]
-                if "name" in chat_model and not chat_model.get("model"):
-                    chat_model["model"] = chat_model["name"]
-            
-            # Ensure embedding model uses 'model' field for API compatibility  
-            if "embeddingModel" in request_data and request_data["embeddingModel"]:
-                embedding_model = request_data["embeddingModel"]
-                if "name" in embedding_model and not embedding_model.get("model"):
-                    embedding_model["model"] = embedding_model["name"]
-            
-            response = await self.client.post(
-                "/api/search",
-                json=request_data,
-                headers={"Content-Type": "application/json"}
+            request_data = self._build_request_data(request)
+            return await self._post_search(
+                request_data,
+                cacheable=not request.history and not request.stream
             )
-            response.raise_for_status()
-            
-            data = response.json()
-            return SearchResponse(**data)
-            
         except httpx.HTTPStatusError as e:
             raise Exception(f"Perplexica API error: {e.response.status_code} - {e.response.text}")
         except httpx.RequestError as e:
             raise Exception(f"Network error connecting to Perplexica: {str(e)}")
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             raise Exception(f"Invalid JSON response from Perplexica: {str(e)}")
-    
+
+    async def search_raw(self, request_data: dict) -> SearchResponse:
+        """Perform a search from a prebuilt wire payload.
+
+        Skips SearchRequest construction and validation entirely; the
+        dict must already be in the wire format _build_request_data
+        produces. Intended for callers that keep precomputed request
+        skeletons and only vary a field or two per call.
+        """
+        try:
+            return await self._post_search(
+                request_data,
+                cacheable=not request_data.get("history") and not request_data.get("stream")
+            )
+        except httpx.HTTPStatusError as e:
+            raise Exception(f"Perplexica API error: {e.response.status_code} - {e.response.text}")
+        except httpx.RequestError as e:
+            raise Exception(f"Network error connecting to Perplexica: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            raise Exception(f"Invalid JSON response from Perplexica: {str(e)}")
+
+
+    async def search_many(self, requests: List[SearchRequest]) -> List[SearchResponse]:
+        """Run several searches concurrently.
+
+        Fan-out is bounded by the client's concurrency semaphore, so N
+        related queries cost roughly one round-trip instead of N.
+        """
+        return await asyncio.gather(*(self.search(r) for r in requests))
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        focusMode: str = "webSearch",
+        **common_kwargs
+    ) -> List[SearchResponse]:
+        """Search several queries that share the same model settings."""
+        requests = [
+            SearchRequest(query=query, focusMode=focusMode, **common_kwargs)
+            for query in queries
+        ]
+        return await self.search_many(requests)
+
     async def search_stream(self, request: SearchRequest) -> AsyncGenerator[StreamMessage, None]:
         """Perform a streaming search."""
         
@@ -84,21 +334,38 @@ class PerplexicaClient:
             request.optimizationMode = self.config.default_optimization_mode
         
         try:
-            async with self.client.stream(
+            # Hold the slot for the life of the stream; the connection is
+            # occupied until the response is fully consumed.
+            async with self._semaphore, self.client.stream(
                 "POST",
                 "/api/search",
-                json={**request.model_dump(exclude_none=True), "stream": True},
-                headers={"Content-Type": "application/json"}
+                content=self._stream_body(request)
             ) as response:
                 response.raise_for_status()
-                
-                async for line in response.aiter_lines():
-                    if line.strip():
-                        try:
-                            data = json.loads(line)
-                            yield StreamMessage(**data)
-                        except json.JSONDecodeError:
-                            continue  # Skip invalid JSON lines
+
+                # Accumulate raw bytes and split lines with a C-level scan
+                # instead of aiter_lines(), which does per-chunk universal
+                # newline decoding in Python.
+                # Large chunks mean fewer Python-level iterations and
+                # fewer buffer resizes per response.
+                buf = bytearray()
+                async for chunk in response.aiter_bytes(
+                    chunk_size=self.config.stream_chunk_size
+                ):
+                    buf += chunk
+                    while (i := buf.find(b"\n")) != -1:
+                        line = bytes(buf[:i])
+                        del buf[:i + 1]
+                        # isspace is C-level and, unlike strip, allocates
+                        # nothing per line
+                        if line and not line.isspace():
+                            message = _parse_stream_line(line)
+                            if message is not None:
+                                yield message
+                if buf and not buf.isspace():
+                    message = _parse_stream_line(bytes(buf))
+                    if message is not None:
+                        yield message
                             
         except httpx.HTTPStatusError as e:
             raise Exception(f"Perplexica API error: {e.response.status_code} - {e.response.text}")
@@ -108,9 +375,10 @@ class PerplexicaClient:
     async def get_models(self) -> dict:
         """Get available models from Perplexica."""
         try:
-            response = await self.client.get("/api/models")
+            async with self._semaphore:
+                response = await self.client.get("/api/models")
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             raise Exception(f"Perplexica API error: {e.response.status_code} - {e.response.text}")
         except httpx.RequestError as e:
@@ -118,8 +386,21 @@ class PerplexicaClient:
     
     async def health_check(self) -> bool:
         """Check if Perplexica API is healthy."""
+        if self._health_cache is not None:
+            ts, healthy = self._health_cache
+            ttl = self._health_ttl if healthy else self._health_failure_ttl
+            if time.monotonic() - ts < ttl:
+                return healthy
+
         try:
-            response = await self.client.get("/api/models", timeout=5.0)
-            return response.status_code == 200
+            # Only the status code matters; stream the GET and close it
+            # without downloading the model list body.
+            async with self._semaphore, self.client.stream(
+                "GET", "/api/models", timeout=5.0
+            ) as response:
+                healthy = response.status_code == 200
         except Exception:
-            return False
\ No newline at end of file
+            healthy = False
+
+        self._health_cache = (time.monotonic(), healthy)
+        return healthy
\ No newline at end of file
@@ -1,17 +1,27 @@
 """Data models for Perplexica API requests and responses."""
 
 from typing import List, Optional, Tuple, Literal, Any, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class ChatModel(BaseModel):
     """Chat model configuration."""
+    # Frozen models are hashable and cheaper to share across requests
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     provider: str = Field(description="The provider for the chat model (e.g., 'openai', 'anthropic')")
     model: Optional[str] = Field(None, description="The specific chat model (e.g., 'gpt-4o-mini', 'claude-3-sonnet')")
-    name: Optional[str] = Field(None, description="Alternative field name for the model (official API compatibility)")
+    name: Optional[str] = Field(None, exclude=True, description="Alternative field name for the model (official API compatibility); mirrored into 'model' and excluded from the wire payload")
     customOpenAIBaseURL: Optional[str] = Field(None, description="Custom OpenAI base URL")
     customOpenAIKey: Optional[str] = Field(None, description="Custom OpenAI API key")
-    
+
+    @model_validator(mode="after")
+    def _sync_model_name(self):
+        """Mirror 'name' into 'model' once so serialization needs no rewrite."""
+        if self.name and not self.model:
+            object.__setattr__(self, "model", self.name)
+        return self
+
     def get_model_name(self) -> str:
         """Get the model name, preferring 'name' field for official API compatibility."""
         return self.name or self.model or ""
@@ -19,10 +29,19 @@ class ChatModel(BaseModel):
 
 class EmbeddingModel(BaseModel):
     """Embedding model configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     provider: str = Field(description="The provider for the embedding model (e.g., 'openai')")
     model: Optional[str] = Field(None, description="The specific embedding model (e.g., 'text-embedding-3-large')")
-    name: Optional[str] = Field(None, description="Alternative field name for the model (official API compatibility)")
-    
+    name: Optional[str] = Field(None, exclude=True, description="Alternative field name for the model (official API compatibility); mirrored into 'model' and excluded from the wire payload")
+
+    @model_validator(mode="after")
+    def _sync_model_name(self):
+        """Mirror 'name' into 'model' once so serialization needs no rewrite."""
+        if self.name and not self.model:
+            object.__setattr__(self, "model", self.name)
+        return self
+
     def get_model_name(self) -> str:
         """Get the model name, preferring 'name' field for official API compatibility."""
         return self.name or self.model or ""
@@ -55,6 +74,9 @@ class SearchRequest(BaseModel):
 
 class Source(BaseModel):
     """Source information for search results."""
+    # extra stays permissive here: these mirror server responses
+    model_config = ConfigDict(frozen=True)
+
     pageContent: str = Field(description="Content snippet from the source")
     metadata: Dict[str, Any] = Field(description="Metadata including title and URL")
 
@@ -67,6 +89,8 @@ class SearchResponse(BaseModel):
 
 class StreamMessage(BaseModel):
     """Streaming message from Perplexica API."""
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["init", "sources", "response", "done", "error"]
     data: Any
 
@@ -84,4 +108,28 @@ class PerplexicaConfig(BaseModel):
     default_output_format: Literal["json", "formatted"] = Field(
         "json",
         description="Default output format for search results"
+    )
+    stream_chunk_size: int = Field(
+        default=65536,
+        description="Chunk size in bytes for reading response bodies"
+    )
+    max_concurrent: int = Field(
+        default=32,
+        description="Max concurrent outbound requests to Perplexica"
+    )
+    retries: int = Field(
+        default=3,
+        description="Retry attempts for transient request failures"
+    )
+    backoff_base: float = Field(
+        default=0.2,
+        description="Base delay in seconds for exponential retry backoff"
+    )
+    search_cache_size: int = Field(
+        default=128,
+        description="Max entries in the in-process search response cache (0 disables)"
+    )
+    search_cache_ttl: float = Field(
+        default=300.0,
+        description="Seconds a cached search response stays valid"
     )
\ No newline at end of file
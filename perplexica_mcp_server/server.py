@@ -1,14 +1,17 @@
 """Perplexica MCP Server implementation."""
 
-import json
+import asyncio
 import os
 import sys
+import time
 import logging
 
+import orjson
 from mcp.server.fastmcp import Context, FastMCP
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from collections.abc import AsyncIterator
+from functools import lru_cache
 
 from .client import PerplexicaClient
 from .models import (
@@ -36,19 +39,27 @@ logging.getLogger('mcp.server.lowlevel').setLevel(logging.WARNING)
 logging.getLogger('mcp.client').setLevel(logging.WARNING)
 logging.getLogger('mcp.shared').setLevel(logging.WARNING)
 
-
-def load_config() -> PerplexicaConfig:
-    """Load configuration from environment variables or config file."""
-    # Try to load .env file if it exists
+# Load .env exactly once at import time; set PERPLEXICA_LOAD_DOTENV=0 to
+# skip the filesystem probe entirely (e.g. in production)
+_ENV_FILE = os.path.join(os.path.dirname(__file__), "..", ".env")
+if os.getenv("PERPLEXICA_LOAD_DOTENV", "1") == "1":
     try:
         from dotenv import load_dotenv
-        env_file = os.path.join(os.path.dirname(__file__), "..", ".env")
-        if os.path.exists(env_file):
-            load_dotenv(env_file)
-            logger.info(f"Loaded environment from {env_file}")
+        if os.path.exists(_ENV_FILE):
+            load_dotenv(_ENV_FILE)
+            logger.info("Loaded environment from %s", _ENV_FILE)
     except ImportError:
         pass  # dotenv not available, use only system environment
-    
+
+
+@lru_cache(maxsize=1)
+def load_config() -> PerplexicaConfig:
+    """Load configuration from environment variables or config file.
+
+    Config is immutable for the server lifetime, so the env scan and
+    Pydantic construction run once and later callers get the cached
+    instance.
+    """
     config_data = {
         "base_url": os.getenv("PERPLEXICA_BASE_URL", "http://localhost:3000"),
         "timeout": int(os.getenv("PERPLEXICA_TIMEOUT", "30")),
@@ -75,9 +86,9 @@ def load_config() -> PerplexicaConfig:
                 chat_model_config["customOpenAIKey"] = custom_key
         
         config_data["default_chat_model"] = ChatModel(**chat_model_config)
-        logger.info(f"Using default chat model: {chat_provider}/{chat_model}")
+        logger.info("Using default chat model: %s/%s", chat_provider, chat_model)
         if chat_provider == "custom_openai":
-            logger.info(f"Custom OpenAI Base URL: {chat_model_config.get('customOpenAIBaseURL', 'Not set')}")
+            logger.info("Custom OpenAI Base URL: %s", chat_model_config.get('customOpenAIBaseURL', 'Not set'))
     
     # Load default embedding model if provided
     embedding_provider = os.getenv("PERPLEXICA_DEFAULT_EMBEDDING_PROVIDER")
@@ -87,26 +98,74 @@ def load_config() -> PerplexicaConfig:
             provider=embedding_provider, 
             name=embedding_model
         )
-        logger.info(f"Using default embedding model: {embedding_provider}/{embedding_model}")
+        logger.info("Using default embedding model: %s/%s", embedding_provider, embedding_model)
     
-    logger.info(f"Configuration loaded: base_url={config_data['base_url']}, timeout={config_data['timeout']}")
+    logger.info("Configuration loaded: base_url=%s, timeout=%s", config_data['base_url'], config_data['timeout'])
     return PerplexicaConfig(**config_data)
 
 
+# Focus modes mapped to whether their tools send an embedding model
+_FOCUS_MODES = {
+    "webSearch": True,
+    "academicSearch": True,
+    "writingAssistant": False,
+    "wolframAlphaSearch": False,
+    "youtubeSearch": False,
+    "redditSearch": False,
+}
+
+
+def _build_skeletons(config: PerplexicaConfig) -> dict:
+    """Precompute per-focus-mode wire payloads for the default settings.
+
+    A search with no per-call overrides only varies in its query, so the
+    rest of the body can be built (and validated) once at startup.
+    """
+    skeletons = {}
+    for focus_mode, include_embeddings in _FOCUS_MODES.items():
+        body = {
+            "optimizationMode": config.default_optimization_mode,
+            "focusMode": focus_mode,
+            "stream": False,
+        }
+        if config.default_chat_model is not None:
+            body["chatModel"] = config.default_chat_model.model_dump(exclude_none=True)
+        if include_embeddings and config.default_embedding_model is not None:
+            body["embeddingModel"] = config.default_embedding_model.model_dump(exclude_none=True)
+        skeletons[focus_mode] = body
+    return skeletons
+
+
 @dataclass
 class AppContext:
     """Application context with typed dependencies."""
     config: PerplexicaConfig
+    client: PerplexicaClient
+    skeletons: dict
+
+
+# Set by app_lifespan so resources (which get no Context) can reach the
+# shared client and config.
+_app_context: AppContext = None
 
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     """Manage application lifecycle with type-safe context."""
+    global _app_context
     logger.info("Initializing application lifespan")
     config = load_config()
+    # One shared client for the whole server lifetime: connection pooling
+    # and TLS handshakes are amortized across all tool calls.
+    client = PerplexicaClient(config)
+    _app_context = AppContext(
+        config=config, client=client, skeletons=_build_skeletons(config)
+    )
     try:
-        yield AppContext(config=config)
+        async with client:
+            yield _app_context
     finally:
+        _app_context = None
         logger.info("Application shutdown complete")
 
 
@@ -114,413 +173,333 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
 mcp = FastMCP("Perplexica MCP Server", lifespan=app_lifespan)
 
 
-def format_search_response(message: str, sources: list, search_type: str = "搜索", output_format: str = "formatted") -> str:
-    """Format search response for better readability."""
-    if output_format == "json":
-        result = {"message": message, "sources": sources}
-        return json.dumps(result, indent=2, ensure_ascii=False)
-    
-    # Format as human-readable text
-    emoji_map = {
-        "网页搜索": "🔍",
-        "学术搜索": "🎓", 
-        "YouTube搜索": "📺",
-        "Reddit搜索": "💬",
-        "写作助手": "✍️"
-    }
-    
-    emoji = emoji_map.get(search_type, "🔍")
-    formatted_text = f"{emoji} **{search_type}结果**\n\n{message}"
-    
+# Static lookup tables and envelopes, built once at import
+_EMOJI_MAP = {
+    "网页搜索": "🔍",
+    "学术搜索": "🎓",
+    "YouTube搜索": "📺",
+    "Reddit搜索": "💬",
+    "写作助手": "✍️"
+}
+
+
+class _TTLCache:
+    """Tiny per-key TTL cache for remote lookups.
+
+    A per-key lock coalesces concurrent loads, so a burst of status
+    polls results in a single upstream request instead of a stampede.
+    """
+
+    def __init__(self):
+        self._entries: dict = {}
+        self._locks: dict = {}
+
+    async def get(self, key: str, ttl: float, loader):
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+            value = await loader()
+            self._entries[key] = (time.monotonic(), value)
+            return value
+
+
+# Shared cache for the models list and health probes
+_remote_cache = _TTLCache()
+_MODELS_TTL = 30.0
+_HEALTH_TTL = 5.0
+
+
+def _dumps(obj, pretty: bool = False) -> str:
+    """Serialize to a JSON string with orjson.
+
+    Compact by default: these payloads are parsed by MCP clients, so
+    indentation is pure overhead on the stdio transport.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0).decode()
+
+
+@lru_cache(maxsize=128)
+def _error_json(message: str) -> str:
+    """Serialize an error envelope; repeated errors reuse the cached string."""
+    return _dumps({"error": message})
+
+
+# Max characters of source content shown in the formatted preview
+_PREVIEW = 150
+
+
+def _iter_formatted(message: str, sources: list, search_type: str = "搜索"):
+    """Yield the formatted response incrementally: header first, then one
+    fragment per source.
+
+    Long responses never exist twice in memory this way, and callers can
+    report progress between fragments.
+    """
+    emoji = _EMOJI_MAP.get(search_type, "🔍")
+    yield f"{emoji} **{search_type}结果**\n\n{message}"
+
     if sources:
-        formatted_text += "\n\n📚 **参考来源**\n"
+        yield "\n\n📚 **参考来源**\n"
         for i, source in enumerate(sources, 1):
-            title = source.get("title", "无标题")
-            url = source.get("url", "")
-            formatted_text += f"\n{i}. **{title}**"
+            get = source.get
+            title = get("title", "无标题")
+            url = get("url", "")
+            parts = [f"\n{i}. **{title}**"]
+            append = parts.append
             if url:
-                formatted_text += f"\n   🔗 {url}"
-            
+                append(f"\n   🔗 {url}")
+
             # 添加内容预览（限制长度）
-            content = source.get("content", "")
+            content = get("content", "")
             if content:
-                preview = content[:150] + "..." if len(content) > 150 else content
-                formatted_text += f"\n   📄 {preview}"
-            formatted_text += "\n"
-    
-    return formatted_text
+                preview = content if len(content) <= _PREVIEW else f"{content[:_PREVIEW]}..."
+                append(f"\n   📄 {preview}")
+            append("\n")
+            yield "".join(parts)
 
-@mcp.tool()
-async def search_web(
-    ctx: Context,
-    query: str,
-    chat_provider: str = None,
-    chat_model: str = None,
-    embedding_provider: str = None,
-    embedding_model: str = None,
-    optimization_mode: str = None,
-    output_format: str = None
-) -> str:
-    """
-    Search the web using Perplexica's AI-powered search engine.
-    
-    Args:
-        query: The search query or question
-        chat_provider: Chat model provider (optional, uses env config if not provided)
-        chat_model: Specific chat model to use (optional, uses env config if not provided)
-        embedding_provider: Embedding model provider (optional, uses env config if not provided)
-        embedding_model: Specific embedding model to use (optional, uses env config if not provided)
-        optimization_mode: Speed vs quality tradeoff (optional, uses env config if not provided)
-        output_format: Output format - "formatted" for human-readable text or "json" for raw JSON
-    
-    Returns:
-        Formatted text with AI response and sources, or JSON if output_format="json"
+
+def format_search_response(message: str, sources: list, search_type: str = "搜索", output_format: str = "formatted") -> str:
+    """Format search response for better readability."""
+    if output_format == "json":
+        result = {"message": message, "sources": sources}
+        return _dumps(result)
+
+    # Format as human-readable text; the generator yields one fragment
+    # per source, so a single join builds the final string
+    return "".join(_iter_formatted(message, sources, search_type))
+
+@lru_cache(maxsize=64)
+def _chat_model(provider: str, name: str, base_url: str = None, key: str = None) -> ChatModel:
+    """Memoized ChatModel constructor for caller-supplied pairs.
+
+    The (provider, model) key space is tiny in practice, so cache hits
+    skip Pydantic validation entirely; the models are frozen, so sharing
+    instances is safe.
     """
-    await ctx.info(f"Web search request: {query}")
-
-    client = PerplexicaClient(ctx.request_context.lifespan_context.config)
-    async with client:
-        try:
-            # Use default output format from config if not provided
-            if output_format is None:
-                output_format = client.config.default_output_format
-            
-            # Build request using provided params or env defaults
-            chat_model_config = None
-            embedding_model_config = None
-            
-            if chat_provider and chat_model:
-                chat_model_config = ChatModel(provider=chat_provider, name=chat_model)
-            elif client.config.default_chat_model:
-                chat_model_config = client.config.default_chat_model
-                
-            if embedding_provider and embedding_model:
-                embedding_model_config = EmbeddingModel(provider=embedding_provider, name=embedding_model)
-            elif client.config.default_embedding_model:
-                embedding_model_config = client.config.default_embedding_model
-            
-            request = SearchRequest(
-                chatModel=chat_model_config,
-                embeddingModel=embedding_model_config,
-                optimizationMode=optimization_mode or client.config.default_optimization_mode,
-                focusMode="webSearch",
-                query=query
-            )
-            
-            response = await client.search(request)
-            logger.info("Web search completed successfully")
-            
-            # Extract message and sources
-            message = getattr(response, 'message', str(response))
-            sources = []
-            
-            if hasattr(response, 'sources') and response.sources:
-                sources = [
-                    {
-                        "content": source.pageContent,
-                        "title": source.metadata.get("title", ""),
-                        "url": source.metadata.get("url", "")
-                    }
-                    for source in response.sources
-                ]
-            
-            # Return formatted output
-            return format_search_response(message, sources, "网页搜索", output_format)
-            
-        except Exception as e:
-            logger.error(f"Web search failed: {e}")
-            return json.dumps({"error": str(e)}, indent=2, ensure_ascii=False)
+    return ChatModel(
+        provider=provider, name=name,
+        customOpenAIBaseURL=base_url, customOpenAIKey=key
+    )
 
 
-@mcp.tool()
-async def search_academic(
+@lru_cache(maxsize=64)
+def _embedding_model(provider: str, name: str) -> EmbeddingModel:
+    """Memoized EmbeddingModel constructor for caller-supplied pairs."""
+    return EmbeddingModel(provider=provider, name=name)
+
+
+async def _run_search(
     ctx: Context,
     query: str,
+    focus_mode: str,
+    label: str,
     chat_provider: str = None,
     chat_model: str = None,
     embedding_provider: str = None,
     embedding_model: str = None,
     optimization_mode: str = None,
-    output_format: str = None
+    output_format: str = None,
+    include_embeddings: bool = True
 ) -> str:
-    """
-    Search academic sources using Perplexica's academic search mode.
-    
-    Args:
-        query: The academic search query
-        chat_provider: Chat model provider (optional, uses env config if not provided)
-        chat_model: Specific chat model to use (optional, uses env config if not provided)
-        embedding_provider: Embedding model provider (optional, uses env config if not provided)
-        embedding_model: Specific embedding model to use (optional, uses env config if not provided)
-        optimization_mode: Speed vs quality tradeoff (optional, uses env config if not provided)
-        output_format: Output format - "formatted" for human-readable text or "json" for raw JSON
-    
-    Returns:
-        Formatted text with AI response and sources, or JSON if output_format="json"
-    """
-    logger.info(f"Academic search request: {query}")
-    client = PerplexicaClient(ctx.request_context.lifespan_context.config)
-    async with client:
-        try:
-            # Use default output format from config if not provided
-            if output_format is None:
-                output_format = client.config.default_output_format
-            
+    """Shared build/search/format path used by all the search tools."""
+    app = ctx.request_context.lifespan_context
+    client = app.client
+    cfg = app.config
+    # Pre-bind hot module globals: this function runs on every tool
+    # invocation, and LOAD_FAST beats LOAD_GLOBAL on each use below
+    _info = logger.info
+    _err = logger.error
+    _sr = SearchRequest
+    try:
+        # Use default output format from config if not provided
+        if output_format is None:
+            output_format = cfg.default_output_format
+
+        if (not (chat_provider and chat_model)
+                and not (embedding_provider and embedding_model)
+                and optimization_mode is None):
+            # No overrides: reuse the precomputed skeleton for this focus
+            # mode and skip SearchRequest validation entirely
+            response = await client.search_raw(
+                {**app.skeletons[focus_mode], "query": query}
+            )
+        else:
             # Build request using provided params or env defaults
             chat_model_config = None
             embedding_model_config = None
-            
+
             if chat_provider and chat_model:
-                chat_model_config = ChatModel(provider=chat_provider, name=chat_model)
-            elif client.config.default_chat_model:
-                chat_model_config = client.config.default_chat_model
-                
-            if embedding_provider and embedding_model:
-                embedding_model_config = EmbeddingModel(provider=embedding_provider, name=embedding_model)
-            elif client.config.default_embedding_model:
-                embedding_model_config = client.config.default_embedding_model
-            
-            request = SearchRequest(
+                chat_model_config = _chat_model(chat_provider, chat_model)
+            elif cfg.default_chat_model:
+                chat_model_config = cfg.default_chat_model
+
+            if include_embeddings:
+                if embedding_provider and embedding_model:
+                    embedding_model_config = _embedding_model(embedding_provider, embedding_model)
+                elif cfg.default_embedding_model:
+                    embedding_model_config = cfg.default_embedding_model
+
+            request = _sr(
                 chatModel=chat_model_config,
                 embeddingModel=embedding_model_config,
-                optimizationMode=optimization_mode or client.config.default_optimization_mode,
-                focusMode="academicSearch",
+                optimizationMode=optimization_mode or cfg.default_optimization_mode,
+                focusMode=focus_mode,
                 query=query
             )
-            
+
             response = await client.search(request)
-            logger.info("Academic search completed successfully")
-            
-            # Extract message and sources
-            message = getattr(response, 'message', str(response))
-            sources = []
-            
-            if hasattr(response, 'sources') and response.sources:
-                sources = [
-                    {
-                        "content": source.pageContent,
-                        "title": source.metadata.get("title", ""),
-                        "url": source.metadata.get("url", "")
-                    }
-                    for source in response.sources
-                ]
-            
-            # Return formatted output
-            return format_search_response(message, sources, "学术搜索", output_format)
-            
-        except Exception as e:
-            logger.error(f"Academic search failed: {e}")
-            return json.dumps({"error": str(e)}, indent=2, ensure_ascii=False)
+        _info("%s completed successfully", label)
+
+        # JSON output serializes the response model directly; only the
+        # formatted path needs the transformed source dicts
+        if output_format == "json":
+            return _dumps(response.model_dump(include={"message", "sources"}))
+
+        sources = [
+            {
+                "content": source.pageContent,
+                "title": source.metadata.get("title", ""),
+                "url": source.metadata.get("url", "")
+            }
+            for source in response.sources or []
+        ]
+
+        # Build the formatted output incrementally, reporting progress
+        # after each source fragment; without a client progress token
+        # report_progress is a no-op and this degrades to a plain join.
+        total = len(sources) + 2 if sources else 1
+        chunks = []
+        for done, chunk in enumerate(_iter_formatted(response.message, sources, label), 1):
+            chunks.append(chunk)
+            await ctx.report_progress(done, total)
+        return "".join(chunks)
 
+    except Exception as e:
+        _err("%s failed: %s", label, e)
+        return _error_json(str(e))
 
-@mcp.tool()
-async def search_youtube(
-    ctx: Context,
-    query: str,
-    chat_provider: str = None,
-    chat_model: str = None,
-    optimization_mode: str = None,
-    output_format: str = None
-) -> str:
-    """
-    Search YouTube videos using Perplexica.
-    
-    Args:
-        query: The YouTube search query
-        chat_provider: Chat model provider (optional, uses env config if not provided)
-        chat_model: Specific chat model to use (optional, uses env config if not provided)
-        optimization_mode: Speed vs quality tradeoff (optional, uses env config if not provided)
-        output_format: Output format - "formatted" for human-readable text or "json" for raw JSON
-    
-    Returns:
-        Formatted text with AI response and sources, or JSON if output_format="json"
-    """
-    logger.info(f"YouTube search request: {query}")
-    client = PerplexicaClient(ctx.request_context.lifespan_context.config)
-    async with client:
-        try:
-            # Use default output format from config if not provided
-            if output_format is None:
-                output_format = client.config.default_output_format
-            
-            # Build request using provided params or env defaults
-            chat_model_config = None
-            
-            if chat_provider and chat_model:
-                chat_model_config = ChatModel(provider=chat_provider, name=chat_model)
-            elif client.config.default_chat_model:
-                chat_model_config = client.config.default_chat_model
-            
-            request = SearchRequest(
-                chatModel=chat_model_config,
-                optimizationMode=optimization_mode or client.config.default_optimization_mode,
-                focusMode="youtubeSearch",
-                query=query
-            )
-            
-            response = await client.search(request)
-            logger.info("YouTube search completed successfully")
-            
-            # Extract message and sources
-            message = getattr(response, 'message', str(response))
-            sources = []
-            
-            if hasattr(response, 'sources') and response.sources:
-                sources = [
-                    {
-                        "content": source.pageContent,
-                        "title": source.metadata.get("title", ""),
-                        "url": source.metadata.get("url", "")
-                    }
-                    for source in response.sources
-                ]
-            
-            # Return formatted output
-            return format_search_response(message, sources, "YouTube搜索", output_format)
-            
-        except Exception as e:
-            logger.error(f"YouTube search failed: {e}")
-            return json.dumps({"error": str(e)}, indent=2, ensure_ascii=False)
 
+_SEARCH_TOOL_DOC = """
+    {summary}
 
-@mcp.tool()
-async def search_reddit(
-    ctx: Context,
-    query: str,
-    chat_provider: str = None,
-    chat_model: str = None,
-    optimization_mode: str = None,
-    output_format: str = None
-) -> str:
-    """
-    Search Reddit discussions using Perplexica.
-    
     Args:
-        query: The Reddit search query
+        query: {query_doc}
         chat_provider: Chat model provider (optional, uses env config if not provided)
         chat_model: Specific chat model to use (optional, uses env config if not provided)
-        optimization_mode: Speed vs quality tradeoff (optional, uses env config if not provided)
+{embed_doc}        optimization_mode: Speed vs quality tradeoff (optional, uses env config if not provided)
         output_format: Output format - "formatted" for human-readable text or "json" for raw JSON
-    
+
     Returns:
         Formatted text with AI response and sources, or JSON if output_format="json"
     """
-    logger.info(f"Reddit search request: {query}")
-    client = PerplexicaClient(ctx.request_context.lifespan_context.config)
-    async with client:
-        try:
-            # Use default output format from config if not provided
-            if output_format is None:
-                output_format = client.config.default_output_format
-            
-            # Build request using provided params or env defaults
-            chat_model_config = None
-            
-            if chat_provider and chat_model:
-                chat_model_config = ChatModel(provider=chat_provider, name=chat_model)
-            elif client.config.default_chat_model:
-                chat_model_config = client.config.default_chat_model
-            
-            request = SearchRequest(
-                chatModel=chat_model_config,
-                optimizationMode=optimization_mode or client.config.default_optimization_mode,
-                focusMode="redditSearch",
-                query=query
-            )
-            
-            response = await client.search(request)
-            logger.info("Reddit search completed successfully")
-            
-            # Extract message and sources
-            message = getattr(response, 'message', str(response))
-            sources = []
-            
-            if hasattr(response, 'sources') and response.sources:
-                sources = [
-                    {
-                        "content": source.pageContent,
-                        "title": source.metadata.get("title", ""),
-                        "url": source.metadata.get("url", "")
-                    }
-                    for source in response.sources
-                ]
-            
-            # Return formatted output
-            return format_search_response(message, sources, "Reddit搜索", output_format)
-            
-        except Exception as e:
-            logger.error(f"Reddit search failed: {e}")
-            return json.dumps({"error": str(e)}, indent=2, ensure_ascii=False)
 
+_EMBED_ARG_DOC = (
+    "        embedding_provider: Embedding model provider (optional, uses env config if not provided)\n"
+    "        embedding_model: Specific embedding model to use (optional, uses env config if not provided)\n"
+)
 
-@mcp.tool()
-async def writing_assistant(
-    ctx: Context,
-    query: str,
-    chat_provider: str = None,
-    chat_model: str = None,
-    optimization_mode: str = None,
-    output_format: str = None
-) -> str:
-    """
-    Use Perplexica's writing assistant mode for writing help and research.
-    
-    Args:
-        query: The writing-related query or request
-        chat_provider: Chat model provider (optional, uses env config if not provided)
-        chat_model: Specific chat model to use (optional, uses env config if not provided)
-        optimization_mode: Speed vs quality tradeoff (optional, uses env config if not provided)
-        output_format: Output format - "formatted" for human-readable text or "json" for raw JSON
-    
-    Returns:
-        Formatted text with AI response and sources, or JSON if output_format="json"
+
+def _make_search_tool(
+    name: str,
+    summary: str,
+    query_doc: str,
+    focus_mode: str,
+    label: str,
+    log_message: str,
+    needs_embed: bool
+):
+    """Build and register one search tool.
+
+    The focus mode and label are captured as closure cells, so each call
+    goes straight to _run_search with them already bound instead of
+    re-deriving them in a per-tool body.
     """
-    logger.info(f"Writing assistant request: {query}")
-    client = PerplexicaClient(ctx.request_context.lifespan_context.config)
-    async with client:
-        try:
-            # Use default output format from config if not provided
-            if output_format is None:
-                output_format = client.config.default_output_format
-            
-            # Build request using provided params or env defaults
-            chat_model_config = None
-            
-            if chat_provider and chat_model:
-                chat_model_config = ChatModel(provider=chat_provider, name=chat_model)
-            elif client.config.default_chat_model:
-                chat_model_config = client.config.default_chat_model
-            
-            request = SearchRequest(
-                chatModel=chat_model_config,
-                optimizationMode=optimization_mode or client.config.default_optimization_mode,
-                focusMode="writingAssistant",
-                query=query
+    if needs_embed:
+        async def tool_fn(
+            ctx: Context,
+            query: str,
+            chat_provider: str = None,
+            chat_model: str = None,
+            embedding_provider: str = None,
+            embedding_model: str = None,
+            optimization_mode: str = None,
+            output_format: str = None
+        ) -> str:
+            logger.info(log_message, query)
+            return await _run_search(
+                ctx, query, focus_mode, label,
+                chat_provider=chat_provider, chat_model=chat_model,
+                embedding_provider=embedding_provider, embedding_model=embedding_model,
+                optimization_mode=optimization_mode, output_format=output_format
             )
-            
-            response = await client.search(request)
-            logger.info("Writing assistant completed successfully")
-            
-            # Extract message and sources
-            message = getattr(response, 'message', str(response))
-            sources = []
-            
-            if hasattr(response, 'sources') and response.sources:
-                sources = [
-                    {
-                        "content": source.pageContent,
-                        "title": source.metadata.get("title", ""),
-                        "url": source.metadata.get("url", "")
-                    }
-                    for source in response.sources
-                ]
-            
-            # Return formatted output
-            return format_search_response(message, sources, "写作助手", output_format)
-            
-        except Exception as e:
-            logger.error(f"Writing assistant failed: {e}")
-            return json.dumps({"error": str(e)}, indent=2, ensure_ascii=False)
+    else:
+        async def tool_fn(
+            ctx: Context,
+            query: str,
+            chat_provider: str = None,
+            chat_model: str = None,
+            optimization_mode: str = None,
+            output_format: str = None
+        ) -> str:
+            logger.info(log_message, query)
+            return await _run_search(
+                ctx, query, focus_mode, label,
+                chat_provider=chat_provider, chat_model=chat_model,
+                optimization_mode=optimization_mode, output_format=output_format,
+                include_embeddings=False
+            )
+
+    # FastMCP derives the tool name, description and schema from the
+    # function, so fix those up before registration
+    tool_fn.__name__ = name
+    tool_fn.__qualname__ = name
+    tool_fn.__doc__ = _SEARCH_TOOL_DOC.format(
+        summary=summary,
+        query_doc=query_doc,
+        embed_doc=_EMBED_ARG_DOC if needs_embed else ""
+    )
+    return mcp.tool()(tool_fn)
+
+
+search_web = _make_search_tool(
+    "search_web",
+    "Search the web using Perplexica's AI-powered search engine.",
+    "The search query or question",
+    "webSearch", "网页搜索", "Web search request: %s", needs_embed=True
+)
+
+search_academic = _make_search_tool(
+    "search_academic",
+    "Search academic sources using Perplexica's academic search mode.",
+    "The academic search query",
+    "academicSearch", "学术搜索", "Academic search request: %s", needs_embed=True
+)
+
+search_youtube = _make_search_tool(
+    "search_youtube",
+    "Search YouTube videos using Perplexica.",
+    "The YouTube search query",
+    "youtubeSearch", "YouTube搜索", "YouTube search request: %s", needs_embed=False
+)
+
+search_reddit = _make_search_tool(
+    "search_reddit",
+    "Search Reddit discussions using Perplexica.",
+    "The Reddit search query",
+    "redditSearch", "Reddit搜索", "Reddit search request: %s", needs_embed=False
+)
+
+writing_assistant = _make_search_tool(
+    "writing_assistant",
+    "Use Perplexica's writing assistant mode for writing help and research.",
+    "The writing-related query or request",
+    "writingAssistant", "写作助手", "Writing assistant request: %s", needs_embed=False
+)
 
 
 @mcp.tool()
@@ -532,15 +511,14 @@ async def get_available_models(ctx: Context) -> str:
         JSON string containing available models
     """
     logger.info("Getting available models")
-    client = PerplexicaClient(ctx.request_context.lifespan_context.config)
-    async with client:
-        try:
-            models = await client.get_models()
-            logger.info("Got available models successfully")
-            return json.dumps(models, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Failed to get available models: {e}")
-            return json.dumps({"error": str(e)}, indent=2, ensure_ascii=False)
+    client = ctx.request_context.lifespan_context.client
+    try:
+        models = await _remote_cache.get("models", _MODELS_TTL, client.get_models)
+        logger.info("Got available models successfully")
+        return _dumps(models)
+    except Exception as e:
+        logger.error("Failed to get available models: %s", e)
+        return _error_json(str(e))
 
 
 @mcp.tool()
@@ -552,51 +530,64 @@ async def health_check(ctx: Context) -> str:
         JSON string with health status
     """
     logger.info("Performing health check")
-    client = PerplexicaClient(ctx.request_context.lifespan_context.config)
-    async with client:
-        try:
-            is_healthy = await client.health_check()
-            logger.info(f"Health check result: {'healthy' if is_healthy else 'unhealthy'}")
-            return json.dumps({
-                "healthy": is_healthy,
-                "message": "Perplexica API is accessible" if is_healthy else "Perplexica API is not accessible"
-            }, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            return json.dumps({"healthy": False, "error": str(e)}, indent=2, ensure_ascii=False)
+    client = ctx.request_context.lifespan_context.client
+    try:
+        is_healthy = await _remote_cache.get("health", _HEALTH_TTL, client.health_check)
+        logger.info("Health check result: %s", "healthy" if is_healthy else "unhealthy")
+        return _dumps({
+            "healthy": is_healthy,
+            "message": "Perplexica API is accessible" if is_healthy else "Perplexica API is not accessible"
+        })
+    except Exception as e:
+        logger.error("Health check failed: %s", e)
+        return _dumps({"healthy": False, "error": str(e)})
+
+
+@lru_cache(maxsize=1)
+def _config_json() -> str:
+    """Serialize the (immutable) configuration once."""
+    return _dumps(load_config().model_dump(), pretty=True)
 
 
 @mcp.resource(uri="perplexica://config")
 async def get_config() -> str:
     """Get current Perplexica configuration."""
     logger.info("Getting configuration")
-    config = load_config()
-    return json.dumps(config.model_dump(), indent=2, ensure_ascii=False)
+    return _config_json()
 
 
 @mcp.resource(uri="perplexica://status")
 async def get_status() -> str:
     """Get Perplexica service status."""
     logger.info("Getting service status")
-    config = load_config()
-    client = PerplexicaClient(config)
-    async with client:
-        try:
-            is_healthy = await client.health_check()
-            models = await client.get_models() if is_healthy else {}
-            logger.info(f"Service status: {'healthy' if is_healthy else 'unhealthy'}")
-            
-            return json.dumps({
-                "status": "healthy" if is_healthy else "unhealthy",
-                "base_url": client.config.base_url,
-                "available_models": models
-            }, indent=2, ensure_ascii=False)
-        except Exception as e:
-            logger.error(f"Failed to get service status: {e}")
-            return json.dumps({
-                "status": "error",
-                "error": str(e)
-            }, indent=2, ensure_ascii=False)
+    client = _app_context.client
+    try:
+        # Probe health and models concurrently instead of sequentially;
+        # a failed models fetch degrades to an empty list rather than
+        # failing the whole status report.
+        is_healthy, models = await asyncio.gather(
+            _remote_cache.get("health", _HEALTH_TTL, client.health_check),
+            _remote_cache.get("models", _MODELS_TTL, client.get_models),
+            return_exceptions=True,
+        )
+        if isinstance(is_healthy, BaseException):
+            raise is_healthy
+        if isinstance(models, BaseException):
+            logger.error("Failed to get available models: %s", models)
+            models = {}
+        logger.info("Service status: %s", "healthy" if is_healthy else "unhealthy")
+
+        return _dumps({
+            "status": "healthy" if is_healthy else "unhealthy",
+            "base_url": client.config.base_url,
+            "available_models": models
+        })
+    except Exception as e:
+        logger.error("Failed to get service status: %s", e)
+        return _dumps({
+            "status": "error",
+            "error": str(e)
+        })
 
 
 def main():
@@ -607,7 +598,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Server shutdown by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
 
 
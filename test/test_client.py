@@ -61,7 +61,9 @@ async def main():
                 result = await session.call_tool("get_available_models", arguments={})
                 if result.content:
                     models_data = json.loads(result.content[0].text)
-                    logger.info(f"Available Models: {json.dumps(models_data, indent=2, ensure_ascii=False)}")
+                    # Pretty-printing the full model list is expensive; only do it when debugging
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Available Models: %s", json.dumps(models_data, indent=2, ensure_ascii=False))
                 
                 # 测试简单的网页搜索
                 logger.info("Testing web search...")
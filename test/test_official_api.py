@@ -1,88 +1,232 @@
 """按照官方文档测试Perplexica API"""
 import asyncio
+import logging
+import os
+import sys
+import time
+from itertools import islice
+
 import httpx
-import json
+import msgspec
+import orjson
+import pytest
+import pytest_asyncio
+
+# 设置日志：默认INFO，压测时DEBUG级的逐行输出会被整体跳过
+logging.basicConfig(
+    level=getattr(logging, os.getenv("LOG_LEVEL", "INFO").upper(), logging.INFO),
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    stream=sys.stderr
+)
+log = logging.getLogger(__name__)
+
+# 连接池+HTTP/2配置：模块级脚本客户端和pytest fixture共用一份
+_CLIENT_KWARGS = dict(
+    base_url="http://localhost:3000",
+    http2=True,
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+# 脚本模式用的长连接客户端，避免每次调用重新付出TCP/TLS握手成本
+_CLIENT = httpx.AsyncClient(**_CLIENT_KWARGS)
+
+# 按照官方文档的请求体结构
+official_request = {
+    "chatModel": {
+        "provider": "custom_openai",
+        "customOpenAIBaseURL":"https://api.poe.com/v1",
+        "customOpenAIKey":"your_api_key",
+        "name": "gpt-4.1"  # 注意：官方文档用的是 'name' 不是 'model'
+    },
+    "embeddingModel": {
+        "provider": "transformers", 
+        "name": "xenova-bge-small-en-v1.5"  # 注意：官方文档用的是 'name'
+    },
+    "optimizationMode": "speed",
+    "focusMode": "webSearch",
+    "query": "What is Perplexica",
+    "history": [
+        ["human", "Hi, how are you?"],
+        ["assistant", "I am doing well, how can I help you today?"]
+    ],
+    "systemInstructions": "Focus on providing technical details about Perplexica's architecture.",
+    "stream": False
+}
+
+# 请求体是常量，导入时序列化一次即可（紧凑字节用于发送，缩进版用于日志）
+_BODY_BYTES = orjson.dumps(official_request)
+_BODY_PRETTY = orjson.dumps(official_request, option=orjson.OPT_INDENT_2).decode()
+
+# 请求头常量：不必每次调用重建dict再由httpx规范化
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class Source(msgspec.Struct):
+    """搜索来源条目，只声明测试用到的字段"""
+    metadata: dict = {}
+
+
+class SearchResult(msgspec.Struct):
+    """/api/search响应的固定结构"""
+    message: str = ""
+    sources: list[Source] = []
+
 
-async def test_official_api():
+# 结构固定时msgspec直接解码成类型化Struct，比orjson+dict索引更快
+_RESULT_DECODER = msgspec.json.Decoder(SearchResult)
+
+
+def _get_title_url(source: Source) -> tuple:
+    """取来源的标题和URL：metadata只查一次"""
+    md = source.metadata
+    return md.get('title', '无标题'), md.get('url', '无URL')
+
+
+async def _post(body: bytes) -> httpx.Response:
+    """发送一次搜索请求，返回原始响应"""
+    return await _CLIENT.post(
+        "/api/search",
+        content=body,
+        headers=_JSON_HEADERS
+    )
+
+async def _warmup(client: httpx.AsyncClient = _CLIENT):
+    """预热连接池：先发一个廉价的HEAD，让后续POST复用已建立的连接"""
+    try:
+        await client.head("/")
+    except Exception:
+        pass  # 预热失败无所谓，正式请求会给出真正的错误
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client():
+    """会话级客户端fixture：整个测试会话共享一个连接池，结束时关闭"""
+    async with httpx.AsyncClient(**_CLIENT_KWARGS) as c:
+        yield c
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_official_api(client: httpx.AsyncClient):
     """按照官方文档测试/api/search接口"""
-    print("🧪 按照官方文档测试Perplexica API")
-    print("=" * 50)
-    
-    # 按照官方文档的请求体结构
-    official_request = {
-        "chatModel": {
-            "provider": "custom_openai",
-            "customOpenAIBaseURL":"https://api.poe.com/v1",
-            "customOpenAIKey":"your_api_key",
-            "name": "gpt-4.1"  # 注意：官方文档用的是 'name' 不是 'model'
-        },
-        "embeddingModel": {
-            "provider": "transformers", 
-            "name": "xenova-bge-small-en-v1.5"  # 注意：官方文档用的是 'name'
-        },
-        "optimizationMode": "speed",
-        "focusMode": "webSearch",
-        "query": "What is Perplexica",
-        "history": [
-            ["human", "Hi, how are you?"],
-            ["assistant", "I am doing well, how can I help you today?"]
-        ],
-        "systemInstructions": "Focus on providing technical details about Perplexica's architecture.",
-        "stream": False
-    }
-    
-    print("📋 测试请求体:")
-    print(json.dumps(official_request, indent=2, ensure_ascii=False))
-    print()
-    
-    client = httpx.AsyncClient(timeout=30.0)
-    
+    log.info("🧪 按照官方文档测试Perplexica API")
+    if log.isEnabledFor(logging.DEBUG):
+        # 大段输出放到线程里写，阻塞的stderr写不占用事件循环
+        await asyncio.to_thread(log.debug, "📋 测试请求体:\n%s", _BODY_PRETTY)
+
+    # TCP+TLS+HTTP/2握手只付一次，之后的请求走同一条连接
+    await _warmup(client)
+
     try:
-        print("🚀 发送请求到 /api/search...")
-        response = await client.post(
-            "http://localhost:3000/api/search",
-            json=official_request,
-            headers={"Content-Type": "application/json"}
-        )
-        
-        print(f"📊 响应状态码: {response.status_code}")
-        print(f"📋 响应头: {dict(response.headers)}")
-        
-        if response.status_code == 200:
-            print("✅ 请求成功!")
-            
-            response_data = response.json()
-            print(f"💬 消息长度: {len(response_data.get('message', ''))}")
-            print(f"📚 来源数量: {len(response_data.get('sources', []))}")
-            
-            # 显示部分响应内容
-            message = response_data.get('message', '')
-            if len(message) > 200:
-                print(f"📄 消息预览: {message[:200]}...")
-            else:
-                print(f"📄 完整消息: {message}")
-                
-            # 显示来源信息
-            sources = response_data.get('sources', [])
-            if sources:
-                print(f"\n📚 前几个来源:")
-                for i, source in enumerate(sources[:3]):
-                    title = source.get('metadata', {}).get('title', '无标题')
-                    url = source.get('metadata', {}).get('url', '无URL')
-                    print(f"   {i+1}. {title}")
-                    print(f"      URL: {url}")
-            
-        else:
-            print(f"❌ 请求失败: HTTP {response.status_code}")
-            print(f"错误响应: {response.text}")
-            
+        log.debug("🚀 发送请求到 /api/search...")
+        # 直接发送orjson编码的字节，绕过httpx内置的json编码器；
+        # 流式接收响应体，避免httpx内部再保留一份完整拷贝
+        async with client.stream(
+            "POST",
+            "/api/search",
+            content=_BODY_BYTES,
+            headers=_JSON_HEADERS
+        ) as response:
+            log.debug("📊 响应状态码: %s", response.status_code)
+            # 直接记录Headers对象，省去为一行调试输出复制整个dict；
+            # repr在DEBUG关闭时完全不会求值
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("📋 响应头: %r", response.headers)
+
+            buf = bytearray()
+            async for chunk in response.aiter_bytes():
+                buf += chunk
+
+        # 非200直接提前返回，不触碰成功分支的JSON解析；
+        # 错误体可能是代理返回的多MB HTML，先截断再解码
+        if response.status_code != 200:
+            log.error("❌ 请求失败: HTTP %d: %s",
+                      response.status_code, buf[:512].decode(errors='replace'))
+            return
+
+        log.info("✅ 请求成功!")
+
+        # 响应结构固定，msgspec按Struct类型解码并顺带完成校验；
+        # 字段和长度各取一次绑定为局部变量，后面不再重复查找
+        result = _RESULT_DECODER.decode(buf)
+        message = result.message
+        sources = result.sources
+        mlen = len(message)
+        log.info("💬 消息长度: %d", mlen)
+        log.info("📚 来源数量: %d", len(sources))
+
+        # 显示部分响应内容
+        if mlen > 200:
+            # %.200s在格式化阶段截断，不先分配切片字符串
+            log.debug("📄 消息预览: %.200s...", message)
+        elif message:
+            # 完整消息可能很长，同样放线程写，run_many并发时不卡事件循环
+            await asyncio.to_thread(log.debug, "📄 完整消息: %s", message)
+
+        # 显示来源信息
+        if sources:
+            log.debug("📚 前几个来源:")
+            # islice避免为前3条来源分配切片列表
+            for i, source in enumerate(islice(sources, 3)):
+                title, url = _get_title_url(source)
+                log.debug("   %d. %s\n      URL: %s", i + 1, title, url)
+
     except Exception as e:
-        print(f"❌ 请求异常: {e}")
-    
+        log.error("❌ 请求异常: %s", e)
+
+
+async def run_many(queries: list, concurrency: int = 32) -> list:
+    """并发验证多个查询变体：请求体提前序列化，有界并发复用连接池"""
+    bodies = [orjson.dumps({**official_request, "query": q}) for q in queries]
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one(body: bytes):
+        async with semaphore:
+            return await _post(body)
+
+    return await asyncio.gather(*(_one(b) for b in bodies))
+
+
+async def bench(n: int = 100, concurrency: int = 64):
+    """压测模式：并发发送n次请求，有界并发+连接池复用"""
+    log.info("🏁 压测 /api/search: %d 次请求, 并发 %d", n, concurrency)
+    await _warmup()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _one():
+        async with semaphore:
+            try:
+                response = await _post(_BODY_BYTES)
+                return response.status_code
+            except Exception as e:
+                return e
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_one() for _ in range(n)))
+    elapsed = time.perf_counter() - start
+
+    ok = sum(1 for r in results if r == 200)
+    log.info("✅ 成功: %d/%d  耗时: %.2fs  RPS: %.1f", ok, n, elapsed, n / elapsed)
+
+
+async def _amain():
+    """脚本入口：跑完用例后在同一个事件循环里关闭客户端"""
+    try:
+        # BENCH_MODE=1 时跑压测循环，默认跑单次官方文档用例
+        if os.getenv("BENCH_MODE", "0") == "1":
+            await bench(int(os.getenv("BENCH_REQUESTS", "100")))
+        else:
+            await test_official_api(_CLIENT)
     finally:
-        await client.aclose()
-    
-   
+        await _CLIENT.aclose()
+
 
 if __name__ == "__main__":
-    asyncio.run(test_official_api())
\ No newline at end of file
+    # uvloop可用时替换默认事件循环（Windows上不可用，缺失时静默跳过）
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    asyncio.run(_amain())
\ No newline at end of file